@@ -3,8 +3,6 @@ from __future__ import division
 from __future__ import print_function
 from builtins import zip
 import os.path
-from itertools import groupby
-from operator import itemgetter
 import ninemlcatalog
 import nest
 import numpy as np
@@ -255,13 +253,17 @@ def run(argv):
                 if args.num_record_v and pop_name != 'Ext':
                     events, = nest.GetStatus(ref.recorders[pop_name]['V_m'],
                                              ["events"])[0]
-                    sorted_vs = sorted(zip(events['senders'], events['times'],
-                                           events['V_m']), key=itemgetter(0))
+                    # Convert the event columns to arrays once and group them
+                    # by sender with a stable sort (preserving time order)
+                    senders = np.asarray(events['senders'])
+                    order = np.argsort(senders, kind='mergesort')
+                    senders = senders[order]
+                    times = np.asarray(events['times'])[order]
+                    vs = np.asarray(events['V_m'])[order]
+                    bounds = np.flatnonzero(np.diff(senders)) + 1
                     plt.sca(v_subplots[-1] if num_subplots > 1 else v_subplots)
-                    for _, group in groupby(sorted_vs, key=itemgetter(0)):
-                        _, t, v = list(zip(*group))
-                        t = np.asarray(t)
-                        v = np.asarray(v)
+                    for t, v in zip(np.split(times, bounds),
+                                    np.split(vs, bounds)):
                         inds = t > args.plot_start
                         plt.plot(t[inds], v[inds])
                     plt.xlim((args.plot_start, args.simtime))
@@ -25,17 +25,14 @@ are not in the model description file.
 from builtins import next
 import collections
 from argparse import ArgumentParser
-from nineml import units as un
-from pype9.simulate.common.code_gen import BaseCodeGenerator
-import quantities as pq
 from pype9.utils.arguments import nineml_model
-from pype9.utils.units import parse_units
 from pype9.utils.logging import logger
 
 RecordSpec = collections.namedtuple('RecordSpec', 'port fname t_start')
 
 
 def argparser():
+    from pype9.simulate.common.code_gen import BaseCodeGenerator
     parser = ArgumentParser(prog='pype9 simulate',
                             description=__doc__)
     parser.add_argument('model', type=nineml_model,
@@ -106,7 +103,10 @@ def run(argv):
     Runs the simulation script from the provided arguments
     """
     import nineml
+    from nineml import units as un
+    import quantities as pq
     from pype9.exceptions import Pype9UsageError
+    from pype9.utils.units import parse_units
     import neo.io
 
     args = argparser().parse_args(argv)
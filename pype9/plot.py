@@ -1,7 +1,9 @@
 from builtins import str
 from builtins import next
+import numpy
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import PatchCollection, LineCollection
 from collections import defaultdict, OrderedDict
 import quantities as pq
 from pype9.utils.logging import logger
@@ -19,11 +21,13 @@ def plot(seg, dims=(20, 16), resolution=300, save=None, show=True,
     # Set the dimension of the figure
     plt_name = seg.name + ' ' if seg.name else ''
     if seg.spiketrains:
-        spike_times = []
-        ids = []
-        for i, spiketrain in enumerate(seg.spiketrains):
-            spike_times.extend(spiketrain)
-            ids.extend([i] * len(spiketrain))
+        # Flatten the spike trains into a single array of times (in the
+        # units of the first train) and a matching array of cell indices
+        units = seg.spiketrains[0].units
+        spike_times = numpy.concatenate(
+            [st.rescale(units).magnitude for st in seg.spiketrains])
+        ids = numpy.repeat(numpy.arange(len(seg.spiketrains)),
+                           [len(st) for st in seg.spiketrains])
         plt.sca(axes[0] if num_subplots > 1 else axes)
         plt.scatter(spike_times, ids)
         plt.xlim((seg.spiketrains[0].t_start, seg.spiketrains[0].t_stop))
@@ -50,17 +54,34 @@ def plot(seg, dims=(20, 16), resolution=300, save=None, show=True,
             label_colours = OrderedDict([(labels[0], None)])
             for label in labels[1:]:
                 label_colours[label] = plt.gca()._get_lines.get_next_color()
+            # Collect the spans and boundaries of each epoch so they can be
+            # drawn as two collections instead of three artists per epoch
+            spans = []
+            span_colours = []
+            boundaries = []
             for label, start, duration in zip(epochs.labels,
                                               epochs.times,
                                               epochs.durations):
                 if label_colours[label] is not None:
-                    end = start + duration
-                    plt.axvspan(start, end, facecolor=label_colours[label],
-                                alpha=regime_alpha)
-                    plt.axvline(start, linestyle=regime_linestyle,
-                                color='gray', linewidth=0.5)
-                    plt.axvline(end, linestyle=regime_linestyle, color='gray',
-                                linewidth=0.5)
+                    end = float(start + duration)
+                    start = float(start)
+                    spans.append(mpatches.Rectangle((start, 0.0), end - start,
+                                                    1.0))
+                    span_colours.append(label_colours[label])
+                    boundaries.append([(start, 0.0), (start, 1.0)])
+                    boundaries.append([(end, 0.0), (end, 1.0)])
+            if spans:
+                ax = plt.gca()
+                # Span the full height of the axes irrespective of y-limits
+                trans = ax.get_xaxis_transform()
+                ax.add_collection(
+                    PatchCollection(spans, facecolors=span_colours,
+                                    edgecolors='none', alpha=regime_alpha,
+                                    transform=trans), autolim=False)
+                ax.add_collection(
+                    LineCollection(boundaries, linestyles=regime_linestyle,
+                                   colors='gray', linewidths=0.5,
+                                   transform=trans), autolim=False)
             for label, colour in label_colours.items():
                 if colour is None:
                     colour = 'white'
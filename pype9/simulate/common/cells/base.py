@@ -22,7 +22,7 @@ from nineml.abstraction import Dynamics, Regime
 from nineml.user import Property, Initial
 from pype9.utils.mpi import mpi_comm, is_mpi_master
 from nineml.exceptions import NineMLNameError
-from pype9.annotations import PYPE9_NS
+from pype9.annotations import PYPE9_NS, BUILD_TRANS, MEMBRANE_VOLTAGE
 from pype9.exceptions import (
     Pype9RuntimeError, Pype9AttributeError, Pype9DimensionError,
     Pype9UsageError, Pype9BuildMismatchError, Pype9NoActiveSimulationError,
@@ -72,19 +72,26 @@ class CellMetaClass(type):
         name = component_class.name + BUILD_NAME_SUFFIX
         if build_version is not None:
             name += build_version
+        Cell = cls._built_types.get(name)
+        if Cell is not None:
+            # If the same component class has already been built with the same
+            # build options there is no need to transform it again
+            if (Cell.build_kwargs == kwargs and
+                    Cell.source_component_class.equals(
+                        component_class, annotations_ns=[PYPE9_NS])):
+                return Cell
         if code_generator is None:
             try:
                 code_generator = cls.Simulation.active().code_generator
             except Pype9NoActiveSimulationError:
                 code_generator = cls.CodeGenerator(base_dir=build_base_dir)
+        # Keep an untransformed copy to check against on subsequent requests
+        # (the transform can add annotations to the component class)
+        source_component_class = component_class.clone()
         # Get transformed build class
         build_component_class = code_generator.transform_for_build(
             name=name, component_class=component_class, **kwargs)
-        try:
-            Cell = cls._built_types[name]
-        except KeyError:
-            build = True
-        else:
+        if Cell is not None:
             if not Cell.build_component_class.equals(
                     build_component_class, annotations_ns=[PYPE9_NS]):
                 serial_kwargs = {'format': 'yaml', 'version': 2,
@@ -110,8 +117,7 @@ class CellMetaClass(type):
                             build_component_class.find_mismatch(
                                 Cell.build_component_class,
                                 annotations_ns=[PYPE9_NS])))
-            build = False
-        if build:
+        else:
             # Only build the components on the root node
             if is_mpi_master():
                 # Generate and compile cell class
@@ -122,13 +128,39 @@ class CellMetaClass(type):
             mpi_comm.barrier()
             # Load newly built model
             code_generator.load_libraries(name, url)
+            state_variable_names = frozenset(
+                component_class.state_variable_names)
+            # Names that are changed by the build transform (i.e. the membrane
+            # voltage) mapped to their names in the built class
+            build_names = {}
+            voltage = component_class.annotations.get(
+                (BUILD_TRANS, PYPE9_NS), MEMBRANE_VOLTAGE, default=None)
+            build_voltage = build_component_class.annotations.get(
+                (BUILD_TRANS, PYPE9_NS), MEMBRANE_VOLTAGE, default=None)
+            if voltage is not None and build_voltage is not None:
+                build_names[voltage] = build_voltage
             # Create class member dict of new class
             dct = {'name': name,
                    'component_class': component_class,
                    'build_component_class': build_component_class,
+                   'source_component_class': source_component_class,
+                   'build_kwargs': kwargs,
+                   # Names of all parameters and state variables that can be
+                   # accessed as attributes, precomputed for fast lookup
+                   '_state_variable_names': state_variable_names,
+                   '_variable_names': state_variable_names.union(
+                       component_class.parameter_names),
+                   # Per-variable dimensions and units, filled on first access
+                   '_variable_dimensions': {},
+                   '_variable_units_strs': {},
+                   '_variable_scalars': {},
+                   '_connection_parameters': {},
+                   '_recordables': {},
+                   '_build_names': build_names,
                    'code_generator': code_generator,
                    'unit_handler': code_generator.UnitHandler(component_class),
                    'Simulation': cls.Simulation}
+            dct.update(cls._simulator_class_members(name))
             # Create new class using Type.__new__ method
             Cell = super(CellMetaClass, cls).__new__(
                 cls, name, (cls.BaseCellClass,), dct)
@@ -136,6 +168,20 @@ class CellMetaClass(type):
             cls._built_types[name] = Cell
         return Cell
 
+    @classmethod
+    def _simulator_class_members(cls, name):  # @UnusedVariable
+        """
+        Returns simulator-specific members (e.g. per-class caches) to add to
+        the class dict of a newly built Cell class. To be overridden by the
+        metaclasses of the simulator backends where required.
+
+        Parameters
+        ----------
+        name : str
+            The name of the built cell class (after its libraries are loaded)
+        """
+        return {}
+
     def __init__(self, component_class, **kwargs):
         # This initializer is empty, but since I have changed the signature of
         # the __new__ method in the deriving metaclasses it complains otherwise
@@ -161,6 +207,8 @@ class Cell(object):
 
     def __init__(self, *args, **kwargs):
         self._in_array = kwargs.pop('_in_array', False)
+        # The (scaled) values of parameters set since the cell was created
+        self._param_values = {}
         # Flag to determine whether the cell has been initialized or not
         # (it makes a difference to how the state of the cell is updated,
         # either saved until the 'initialze' method is called or directly
@@ -169,8 +217,7 @@ class Cell(object):
         self._t_start = sim.t_start
         self._t_stop = None
         if self.in_array:
-            for k, v in kwargs.items():
-                self._set(k, v)  # Values should be in the right units.
+            self._set_multiple(kwargs)  # Values should be in the right units.
             self._regime_index = None
         else:
             # These position arguments are a little more complex to retrieve
@@ -218,7 +265,7 @@ class Cell(object):
             for name, qty in kwargs.items():
                 if isinstance(qty, pq.Quantity):
                     qty = self.unit_handler.from_pq_quantity(qty)
-                if name in self.component_class.state_variable_names:
+                if name in self._state_variable_names:
                     initial_values.append(nineml.Initial(name, qty))
                 else:
                     properties.append(nineml.Property(name, qty))
@@ -229,13 +276,15 @@ class Cell(object):
                 check_initial_values=True)
             # Set up references from parameter names to internal variables and
             # set parameters
+            values = {}
             for p in chain(self.properties, self.initial_values):
                 qty = p.quantity
                 if qty.value.nineml_type != 'SingleValue':
                     raise Pype9UsageError(
                         "Only SingleValue quantities can be used to initiate "
                         "individual cell classes ({})".format(p))
-                self._set(p.name, float(self.unit_handler.scale_value(qty)))
+                values[p.name] = self._scale(p.name, qty)
+            self._set_multiple(values)
             sim.register_cell(self)
 
     @property
@@ -254,8 +303,7 @@ class Cell(object):
         super(Cell, self).__setattr__('_created', flag)
 
     def __contains__(self, varname):
-        return varname in chain(self.component_class.parameter_names,
-                                self.component_class.state_variable_names)
+        return varname in self._variable_names
 
     def __getattr__(self, varname):
         """
@@ -267,14 +315,9 @@ class Cell(object):
                     "'{}' is not an attribute nor parameter or state variable "
                     "of the '{}' component class ('{}')"
                     .format(varname, self.component_class.name,
-                            "', '".join(chain(
-                                self.component_class.parameter_names,
-                                self.component_class.state_variable_names))))
-            val = self._get(varname)
-            qty = self.unit_handler.assign_units(
-                val, self.component_class.element(
-                    varname, child_types=Dynamics.nineml_children).dimension)
-            return qty
+                            self._variable_names_str()))
+            return pq.Quantity(self._get(varname),
+                               self._units_str_of(varname))
 
     def __setattr__(self, varname, val):
         """
@@ -294,32 +337,118 @@ class Cell(object):
                     "'{}' is not a parameter or state variable of the '{}'"
                     " component class ('{}')"
                     .format(varname, self.component_class.name,
-                            "', '".join(chain(
-                                self.component_class.parameter_names,
-                                self.component_class.state_variable_names))))
+                            self._variable_names_str()))
             if isinstance(val, pq.Quantity):
                 qty = self.unit_handler.from_pq_quantity(val)
             else:
                 qty = val
-            if qty.units.dimension != self.component_class.dimension_of(
-                    varname):
+            dimension = self._dimension_of(varname)
+            if qty.units.dimension != dimension:
                 raise Pype9DimensionError(
                     "Attempting so set '{}', which has dimension {} to "
                     "{}, which has dimension {}".format(
-                        varname,
-                        self.component_class.dimension_of(varname), qty,
-                        qty.units.dimension))
+                        varname, dimension, qty, qty.units.dimension))
+            value = self._scale(varname, qty)
+            # Parameters of cells outside of arrays are only changed by
+            # assignment (unlike state variables), so don't need to be set
+            # again if they haven't changed
+            track_value = not (self.in_array or
+                               varname in self._state_variable_names)
+            if track_value and self._param_values.get(varname) == value:
+                return
             if not self.in_array:
                 # Set the quantity in the nineml class
-                if varname in self.component_class.state_variable_names:
+                if varname in self._state_variable_names:
                     self._nineml.set(Initial(varname, qty))
                 else:
                     self._nineml.set(Property(varname, qty))
             # Set the value in the simulator
-            self._set(varname, float(self.unit_handler.scale_value(qty)))
+            self._set(varname, value)
+            if track_value:
+                self._param_values[varname] = value
         else:
             super(Cell, self).__setattr__(varname, val)
 
+    @classmethod
+    def _variable_names_str(cls):
+        """
+        Lists the names of the parameters and state variables for use in
+        error messages
+        """
+        return "', '".join(sorted(cls._variable_names))
+
+    @classmethod
+    def _dimension_of(cls, varname):
+        """
+        Returns the dimension of a parameter or state variable, which is cached
+        as it is checked every time the variable is set
+        """
+        try:
+            return cls._variable_dimensions[varname]
+        except KeyError:
+            dimension = cls.component_class.dimension_of(varname)
+            cls._variable_dimensions[varname] = dimension
+            return dimension
+
+    @classmethod
+    def _recordable(cls, port_name):
+        """
+        Returns the send port or state variable matching the given name, which
+        is cached to avoid repeating the lookup (and the exception raised when
+        falling back to state variables) each time it is recorded
+        """
+        try:
+            return cls._recordables[port_name]
+        except KeyError:
+            try:
+                recordable = cls.component_class.send_port(port_name)
+            except NineMLNameError:
+                try:
+                    # For convenient access to state variables
+                    recordable = cls.component_class.state_variable(
+                        port_name)
+                except NineMLNameError:
+                    raise NineMLNameError(
+                        "No matching state variable or event send port "
+                        "matching port name '{}' in component class '{}'"
+                        .format(port_name, cls.component_class.name))
+            cls._recordables[port_name] = recordable
+            return recordable
+
+    @classmethod
+    def _units_str_of(cls, varname):
+        """
+        Returns the units the simulator uses for a parameter or state
+        variable, which is cached as it is required every time the variable is
+        accessed
+        """
+        try:
+            return cls._variable_units_strs[varname]
+        except KeyError:
+            units_str = cls.unit_handler.dimension_to_unit_str(
+                cls.component_class.element(
+                    varname, child_types=Dynamics.nineml_children).dimension)
+            cls._variable_units_strs[varname] = units_str
+            return units_str
+
+    @classmethod
+    def _scale(cls, varname, qty):
+        """
+        Scales a quantity of a parameter or state variable to the units used
+        by the simulator. As the dimension of each variable is fixed, the
+        scalar only depends on the power of the quantity's units and is cached
+        for each variable and power.
+        """
+        if qty.value.nineml_type != 'SingleValue':
+            return float(cls.unit_handler.scale_value(qty))
+        key = (varname, qty.units.power)
+        try:
+            scalar = cls._variable_scalars[key]
+        except KeyError:
+            scalar = cls.unit_handler.scalar(qty.units)
+            cls._variable_scalars[key] = scalar
+        return float(qty.value) * scalar
+
     def set_regime(self, regime):
         if regime not in self.component_class.regime_names:
             raise Pype9UsageError(
@@ -544,20 +673,32 @@ class Cell(object):
         """
         raise NotImplementedError("Should be implemented by derived class")
 
+    def _set_multiple(self, values):
+        """
+        Sets the values of multiple variables in the simulator. Can be
+        overridden in derived classes where the simulator is able to set them
+        all in a single call.
+
+        Parameters
+        ----------
+        values : dict(str, float)
+            The values (in simulator units) to set, keyed by variable name
+        """
+        for varname, value in values.items():
+            self._set(varname, value)
+
     def _check_connection_properties(self, port_name, properties):
-        props_dict = dict((p.name, p) for p in properties)
-        try:
-            param_set = self._nineml.component_class.connection_parameter_set(
-                port_name)
-        except NineMLNameError:
+        params = self._connection_parameters_of(port_name)
+        if params is None:
             return  # No parameter set, so no need to check
-        params_dict = dict((p.name, p) for p in param_set.parameters)
-        if set(props_dict.keys()) != set(params_dict.keys()):
+        params_dict, param_names = params
+        prop_names = set(p.name for p in properties)
+        if prop_names != param_names:
             raise Pype9RuntimeError(
                 "Mismatch between provided property and parameter names:"
                 "\nParameters: '{}'\nProperties: '{}'"
                 .format("', '".join(iter(params_dict.keys())),
-                        "', '".join(iter(props_dict.keys()))))
+                        "', '".join(prop_names)))
         for prop in properties:
             if params_dict[prop.name].dimension != prop.units.dimension:
                 raise Pype9RuntimeError(
@@ -566,6 +707,28 @@ class Cell(object):
                     .format(prop.name, prop.units.dimension,
                             params_dict[prop.name].dimension))
 
+    @classmethod
+    def _connection_parameters_of(cls, port_name):
+        """
+        Returns a dictionary of the connection parameters of the given port
+        and the set of their names (or None if the port doesn't have any),
+        which are cached as they are checked every time a connection is made
+        to the port
+        """
+        try:
+            return cls._connection_parameters[port_name]
+        except KeyError:
+            try:
+                param_set = cls.component_class.connection_parameter_set(
+                    port_name)
+            except NineMLNameError:
+                params = None
+            else:
+                params_dict = dict((p.name, p) for p in param_set.parameters)
+                params = (params_dict, frozenset(params_dict))
+            cls._connection_parameters[port_name] = params
+            return params
+
     def _kill(self, t_stop):
         """
         Caches recording data and sets all references to the actual
@@ -336,21 +336,22 @@ class WithSynapses(with_metaclass(ABCMeta, object)):
         self._dynamics = dynamics
         self.add(*synapses)
         self.add(*connection_parameter_sets)
-        for conn_param in self.all_connection_parameters():
-            try:
-                dyn_param = self._dynamics.parameter(conn_param.name)
+        dyn_params = dict((p.name, p) for p in self._dynamics.parameters)
+        for conn_param_set in self.connection_parameter_sets:
+            for conn_param in conn_param_set.parameters:
+                try:
+                    dyn_param = dyn_params[conn_param.name]
+                except KeyError:
+                    raise Pype9RuntimeError(
+                        "Connection parameter '{}' does not refer to a "
+                        "parameter in the base MultiDynamics class ('{}')"
+                        .format(conn_param, "', '".join(dyn_params)))
                 if conn_param.dimension != dyn_param.dimension:
                     raise Pype9RuntimeError(
                         "Inconsistent dimensions between connection parameter"
                         " '{}' ({}) and parameter of the same name ({})"
                         .format(conn_param.name, conn_param.dimension,
                                 dyn_param.dimension))
-            except NineMLNameError:
-                raise Pype9RuntimeError(
-                    "Connection parameter '{}' does not refer to a parameter "
-                    "in the base MultiDynamics class ('{}')"
-                    .format(conn_param, "', '".join(
-                        sp.name for sp in self._dynamics.parameters)))
         self._dimension_resolver = None
 
     @property
@@ -374,7 +375,8 @@ class WithSynapses(with_metaclass(ABCMeta, object)):
             cp.parameters for cp in self.connection_parameter_sets)))
 
     def all_connection_parameter_names(self):
-        return (p.name for p in self.all_connection_parameters())
+        return frozenset(p.name for cp in self.connection_parameter_sets
+                         for p in cp.parameters)
 
     @property
     def dynamics(self):
@@ -382,8 +384,9 @@ class WithSynapses(with_metaclass(ABCMeta, object)):
 
     @property
     def parameters(self):
+        conn_param_names = self.all_connection_parameter_names()
         return (p for p in self._dynamics.parameters
-                if p.name not in self.all_connection_parameter_names())
+                if p.name not in conn_param_names)
 
     @property
     def attributes_with_dimension(self):
@@ -602,8 +605,9 @@ class WithSynapsesProperties(with_metaclass(ABCMeta, object)):
 
     @property
     def properties(self):
+        conn_prop_names = self._all_connection_property_names()
         return (p for p in self._dynamics_properties.properties
-                if p.name not in self._all_connection_property_names())
+                if p.name not in conn_prop_names)
 
     @property
     def property_names(self):
@@ -649,7 +653,8 @@ class WithSynapsesProperties(with_metaclass(ABCMeta, object)):
             cp.properties for cp in self.connection_property_sets)))
 
     def _all_connection_property_names(self):
-        return (p.name for p in self._all_connection_properties())
+        return frozenset(p.name for cp in self.connection_property_sets
+                         for p in cp.properties)
 
     # NB: Has to be defined last to avoid overriding the in-built decorator
     # named 'property' as used above
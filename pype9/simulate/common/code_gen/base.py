@@ -15,10 +15,10 @@ from future.utils import PY3
 import platform
 import os
 import subprocess as sp
-import time
 from itertools import chain
 from copy import deepcopy
 import shutil
+from importlib import import_module
 from os.path import join
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 from future.utils import with_metaclass
@@ -46,6 +46,8 @@ BASE_BUILD_DIR = os.path.join(
     'v{}'.format(__version__),
     'python{}'.format(sysconfig.get_config_var('py_version')))
 
+url_path_re = re.compile(r'(:?\w+://)?([\.\/\w]+).*')
+
 
 class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
     """
@@ -69,6 +71,7 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
     _INSTL_DIR = 'install'
     _CMPL_DIR = 'compile'  # Ignored for NEURON but used for NEST
     _BUILT_COMP_CLASS = 'built_component_class.xml'
+    _COMPILED_STAMP = '.compiled'  # Written after successful compilation
 
     # Python functions and annotations to be made available in the templates
     _globals = dict(
@@ -126,6 +129,17 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
     def compile_source_files(self, compile_dir, name):
         pass
 
+    def simulator_build_id(self):
+        """
+        Returns a string identifying the simulator installation that the
+        sources are compiled against. It is written to the compiled stamp so
+        that lazy builds recompile when the simulator is reinstalled (the
+        simulator version is already part of the build directory path).
+        """
+        module_path = import_module(self.SIMULATOR_NAME).__file__
+        return '{} {} {}'.format(self.SIMULATOR_VERSION, module_path,
+                                 os.path.getmtime(module_path))
+
     def generate(self, component_class, build_mode='lazy', url=None, **kwargs):
         """
         Generates and builds the required simulator-specific files for a given
@@ -171,6 +185,8 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
         install_dir = self.get_install_dir(name, url)
         # Path of the build component class
         built_comp_class_pth = os.path.join(src_dir, self._BUILT_COMP_CLASS)
+        # Path of the file marking that the sources have been compiled
+        compiled_stamp_pth = os.path.join(src_dir, self._COMPILED_STAMP)
         # Determine whether the installation needs rebuilding or whether there
         # is an existing library module to use.
         if build_mode == 'purge':
@@ -186,7 +202,6 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
             generate_source = True
             compile_source = False
         elif build_mode == 'lazy':  # Generate if source has been modified
-            compile_source = True
             if not os.path.exists(built_comp_class_pth):
                 generate_source = True
             else:
@@ -209,6 +224,18 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
                     logger.info("Found existing source in '{}' directory, "
                                 "but could not find '{}' component class so "
                                 "regenerating sources".format(name, src_dir))
+            # Only recompile if the sources have changed, a previous
+            # compilation didn't complete or the simulator has been reinstalled
+            if (not generate_source and os.path.exists(install_dir) and
+                    self._read_compiled_stamp(compiled_stamp_pth) ==
+                    self.simulator_build_id()):
+                compile_source = False
+                logger.info("Found existing compiled library in '{}' "
+                            "directory, compilation skipped (set "
+                            "'build_mode' argument to 'force' or 'build_only' "
+                            "to enforce recompilation)".format(install_dir))
+            else:
+                compile_source = True
         # Check if required directories are present depending on build_mode
         elif build_mode == 'require':
             if not os.path.exists(install_dir):
@@ -220,6 +247,10 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
             raise Pype9BuildError(
                 "Unrecognised build option '{}', must be one of ('{}')"
                 .format(build_mode, "', '".join(self.BUILD_MODE_OPTIONS)))
+        # Any previous compilation is invalidated by regenerating or
+        # recompiling the sources
+        if generate_source or compile_source:
+            remove_ignore_missing(compiled_stamp_pth)
         # Generate source files from NineML code
         if generate_source:
             self.clean_src_dir(src_dir, name)
@@ -242,12 +273,24 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
                     install_dir=install_dir, **kwargs)
                 self.clean_install_dir(install_dir)
             self.compile_source_files(compile_dir, name)
+            # Mark the sources as compiled against the current simulator
+            # installation so lazy builds can skip compilation
+            with open(compiled_stamp_pth, 'w') as f:
+                f.write(self.simulator_build_id())
         # Switch back to original dir
         os.chdir(orig_dir)
         # Cache any dimension maps that were calculated during the generation
         # process
         return install_dir
 
+    @classmethod
+    def _read_compiled_stamp(cls, compiled_stamp_pth):
+        try:
+            with open(compiled_stamp_pth) as f:
+                return f.read()
+        except IOError:
+            return None
+
     def get_build_dir(self, name, url):
         return os.path.join(self.base_dir, self.url_build_path(url), name)
 
@@ -442,10 +485,14 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
 
     @classmethod
     def get_mod_time(cls, url):
+        """
+        Returns the modification time of the url as seconds since the epoch
+        (so it can be compared directly)
+        """
         if url is None:
-            mod_time = time.ctime(0)  # Return the earliest date if no url
+            mod_time = 0.0  # Return the earliest time if no url
         else:
-            mod_time = time.ctime(os.path.getmtime(url))
+            mod_time = os.path.getmtime(url)
         return mod_time
 
     @classmethod
@@ -456,7 +503,7 @@ class BaseCodeGenerator(with_metaclass(ABCMeta, object)):
             if url_re.match(url) is not None:
                 path = os.path.join(
                     'url',
-                    re.match(r'(:?\w+://)?([\.\/\w]+).*', url).group(1))
+                    url_path_re.match(url).group(1))
             else:
                 path = os.path.join('file', os.path.realpath(url)[1:])
         return path
@@ -15,10 +15,23 @@ from pype9.exceptions import Pype9RuntimeError
 
 class PyNNConnectivity(BaseConnectivity):
 
+    # Default connection probability below which probabilistic connectivity is
+    # sampled by drawing the gaps between successive connections instead of a
+    # Bernoulli trial for every possible pair. Drawing geometric gaps costs
+    # more per draw than drawing uniform numbers, so it is only cheaper when
+    # connections are sparse (in numpy the two break even at around p=0.15
+    # for 10^6 pairs), and the explicit connection list passed to PyNN adds a
+    # cost per connection, so a lower threshold is used. Can be overridden
+    # with the 'sparse_probability' keyword argument.
+    SPARSE_PROBABILITY = 0.1
+
     def __init__(self, *args, **kwargs):
         super(PyNNConnectivity, self).__init__(*args, **kwargs)
         self._prev_connected = None
+        self._connection_mask = None
         self._rng = kwargs['rng']
+        self._sparse_probability = kwargs.get('sparse_probability',
+                                              self.SPARSE_PROBABILITY)
         self._kwargs = kwargs
 
     def connections(self):
@@ -49,11 +62,16 @@ class PyNNConnectivity(BaseConnectivity):
                 assert len(src) == len(dst)
                 params = {'conn_list': list(zip(src, dst))}
             elif self.rule_properties.lib_type == 'Probabilistic':
-                connector_cls = self._pyNN_module.FixedProbabilityConnector
-                params = {
-                    'p_connect':
-                    float(self.rule_properties.property('probability').value),
-                    'rng': None}
+                p_connect = float(
+                    self.rule_properties.property('probability').value)
+                if 0.0 < p_connect < self._sparse_probability:
+                    connector_cls = self._pyNN_module.FromListConnector
+                    params = {'conn_list': self._sample_sparse(
+                        p_connect, connection_group.pre.size,
+                        connection_group.post.size)}
+                else:
+                    connector_cls = self._pyNN_module.FixedProbabilityConnector
+                    params = {'p_connect': p_connect, 'rng': None}
             elif self.rule_properties.lib_type == 'RandomFanIn':
                 connector_cls = self._pyNN_module.FixedNumberPreConnector
                 params = {'n':
@@ -72,13 +90,46 @@ class PyNNConnectivity(BaseConnectivity):
             connector.connect(connection_group)
             self._prev_connected = connection_group
 
+    def _sample_sparse(self, p_connect, num_pre, num_post):
+        """
+        Samples the (pre, post) index pairs of a probabilistic connection rule
+        by drawing the geometrically distributed gaps between successive
+        connections over the flattened pre x post index space. This only
+        draws as many random numbers as there are connections (instead of one
+        per possible pair) but produces the same distribution.
+
+        The gaps are drawn from the numpy RandomState wrapped by the PyNN
+        NumpyRNG, as NumpyRNG does not provide a geometric distribution.
+        """
+        geometric = self._rng.rng.geometric
+        num_pairs = num_pre * num_post
+        # Draw enough gaps that a second draw is rarely required
+        batch_size = int(num_pairs * p_connect +
+                         5 * numpy.sqrt(num_pairs * p_connect)) + 1
+        inds = numpy.cumsum(geometric(p_connect, size=batch_size)) - 1
+        while inds[-1] < num_pairs:
+            inds = numpy.concatenate((inds, inds[-1] + numpy.cumsum(
+                geometric(p_connect, size=batch_size))))
+        inds = inds[inds < num_pairs]
+        return numpy.column_stack(divmod(inds, num_post))
+
     def has_been_sampled(self):
         return self._prev_connected is not None
 
     @property
     def _connection_map(self):
-        return LazyArray(~numpy.isnan(
-            self._prev_connected.get(['weight'], 'array', gather='all')[0]))
+        if self._connection_mask is None:
+            # Build the boolean mask from the list of connected pairs instead
+            # of a dense array of weights, and cache it as it is reused for
+            # every connection group sampled from this connectivity
+            conns = numpy.asarray(
+                self._prev_connected.get(['weight'], 'list', gather='all'))
+            conns = conns.reshape(-1, 3)
+            mask = numpy.zeros((self._prev_connected.pre.size,
+                                self._prev_connected.post.size), dtype=bool)
+            mask[conns[:, 0].astype(int), conns[:, 1].astype(int)] = True
+            self._connection_mask = mask
+        return LazyArray(self._connection_mask)
 
     def clone(self, memo=None, **kwargs):
         if memo is None:
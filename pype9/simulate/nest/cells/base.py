@@ -17,7 +17,6 @@ from nineml import units as un
 from ..code_gen import CodeGenerator
 from pype9.simulate.nest.simulation import Simulation
 from pype9.simulate.common.cells import base
-from pype9.annotations import PYPE9_NS, MEMBRANE_VOLTAGE, BUILD_TRANS
 from pype9.exceptions import (
     Pype9UsageError, Pype9Unsupported9MLException)
 from pype9.utils.logging import logger
@@ -25,6 +24,13 @@ from pype9.utils.logging import logger
 basic_nineml_translations = {
     'Voltage': 'V_m', 'Diameter': 'diam', 'Length': 'L'}
 
+EVENT_SEND_PORT_TYPES = frozenset(('EventSendPort', 'EventSendPortExposure'))
+EVENT_RECEIVE_PORT_TYPES = frozenset(('EventReceivePort',
+                                      'EventReceivePortExposure'))
+ANALOG_RECEIVE_PORT_TYPES = frozenset((
+    'AnalogReceivePort', 'AnalogReducePort', 'AnalogReceivePortExposure',
+    'AnalogReducePortExposure'))
+
 
 class Cell(base.Cell):
 
@@ -32,8 +38,7 @@ class Cell(base.Cell):
         self._flag_created(False)
         self._cell = nest.Create(self.__class__.name)
         super(Cell, self).__init__(*properties, **kwprops)
-        self._receive_ports = nest.GetDefaults(
-            self.__class__.name)['receptor_types']
+        self._receive_ports = self._receptor_types
         self._inputs = {}
         self._flag_created(True)
 
@@ -43,6 +48,9 @@ class Cell(base.Cell):
     def _set(self, varname, value):
         nest.SetStatus(self._cell, varname, value)
 
+    def _set_multiple(self, values):
+        nest.SetStatus(self._cell, values)
+
     def _set_regime(self):
         nest.SetStatus(self._cell, self.code_generator.REGIME_VARNAME,
                        self._regime_index)
@@ -52,18 +60,8 @@ class Cell(base.Cell):
         # created initially to save memory if recordings are not required or
         # handled externally
         self._initialize_local_recording()
-        try:
-            port = self.component_class.send_port(port_name)
-        except NineMLNameError:
-            try:
-                # For convenient access to state variables
-                port = self.component_class.state_variable(port_name)
-            except NameError:
-                raise NineMLNameError(
-                    "No matching state variable or event send port matching "
-                    "port name '{}' in component class '{}'".format(
-                        port_name, self.component_class.name))
-        if port.nineml_type in ('EventSendPort', 'EventSendPortExposure'):
+        port = self._recordable(port_name)
+        if port.nineml_type in EVENT_SEND_PORT_TYPES:
             # FIXME: This assumes that all event send port are spikes, which
             #        I think is currently a limitation of NEST
             self._recorders[port_name] = recorder = nest.Create(
@@ -101,11 +99,7 @@ class Cell(base.Cell):
         each neuron, ids as keys.
         """
         # NB: Port could also be a state variable
-        try:
-            port = self.component_class.send_port(port_name)
-        except NineMLNameError:
-            # For convenient access to state variables
-            port = self.component_class.state_variable(port_name)
+        port = self._recordable(port_name)
         if self.is_dead():
             t_stop = self._t_stop
         else:
@@ -114,7 +108,7 @@ class Cell(base.Cell):
             t_start = self.unit_handler.to_pq_quantity(self._t_start)
         t_start = pq.Quantity(t_start, 'ms')
         t_stop = self.unit_handler.to_pq_quantity(t_stop)
-        if port.nineml_type in ('EventSendPort', 'EventSendPortExposure'):
+        if port.nineml_type in EVENT_SEND_PORT_TYPES:
             spikes = nest.GetStatus(
                 self._recorders[port_name], 'events')[0]['times']
             data = neo.SpikeTrain(
@@ -150,11 +144,7 @@ class Cell(base.Cell):
 
     def build_name(self, varname):
         # Get mapped port name if port corresponds to membrane voltage
-        if varname == self.component_class.annotations.get(
-                (BUILD_TRANS, PYPE9_NS), MEMBRANE_VOLTAGE, default=None):
-            varname = self.build_component_class.annotations.get(
-                (BUILD_TRANS, PYPE9_NS), MEMBRANE_VOLTAGE)
-        return varname
+        return self._build_names.get(varname, varname)
 
     def reset_recordings(self):
         logger.warning("Haven't worked out how to implement reset recordings "
@@ -174,22 +164,25 @@ class Cell(base.Cell):
             The connection properties of the event port
         """
         port = self.component_class.receive_port(port_name)
-        if port.nineml_type in ('EventReceivePort',
-                                'EventReceivePortExposure'):
+        # Look up the active simulation's device delay only once
+        device_delay_ms = self.device_delay_ms
+        if port.nineml_type in EVENT_RECEIVE_PORT_TYPES:
             # Shift the signal times to account for the minimum delay and
             # match the NEURON implementation
             spike_times = (numpy.asarray(signal.rescale(pq.ms)) -
-                           self.device_delay_ms)
-            if any(spike_times <= 0.0):
+                           device_delay_ms)
+            too_early = spike_times <= 0.0
+            if too_early.any():
                 raise Pype9UsageError(
-                    "Some spike times are less than device delay and so "
-                    "can't be played into cell ({})".format(', '.join(
-                        spike_times <
-                        self.device_delay_ms)))
+                    "Some spike times are less than device delay ({}) and so "
+                    "can't be played into cell ({})".format(
+                        self.device_delay, ', '.join(
+                            str(t) for t in
+                            spike_times[too_early] + device_delay_ms)))
             self._inputs[port_name] = nest.Create(
                 'spike_generator', 1, {'spike_times': list(spike_times)})
             syn_spec = {'receptor_type': self._receive_ports[port_name],
-                        'delay': self.device_delay_ms}
+                        'delay': device_delay_ms}
             self._check_connection_properties(port_name, properties)
             if len(properties) > 1:
                 raise NotImplementedError(
@@ -199,31 +192,34 @@ class Cell(base.Cell):
                     properties[0].quantity)
             nest.Connect(self._inputs[port_name], self._cell,
                          syn_spec=syn_spec)
-        elif port.nineml_type in ('AnalogReceivePort', 'AnalogReducePort',
-                                  'AnalogReceivePortExposure',
-                                  'AnalogReducePortExposure'):
+        elif port.nineml_type in ANALOG_RECEIVE_PORT_TYPES:
             # Signals are played into NEST cells include a delay (set to be the
             # minimum), which is is subtracted from the start of the signal so
             # that the effect of the signal aligns with other simulators
             t_start = (float(signal.t_start.rescale(pq.ms)) -
-                       self.device_delay_ms)
+                       device_delay_ms)
             if t_start <= 0.0:
                 raise Pype9UsageError(
                     "Start time of signal played into port '{}' ({}) must "
                     "be greater than device delay ({})".format(
                         port_name, signal.t_start, self.device_delay))
+            # Rescaling returns a new array so the delay can be subtracted
+            # from it in place
+            amplitude_times = numpy.ravel(numpy.asarray(
+                signal.times.rescale(pq.ms), dtype=float))
+            numpy.subtract(amplitude_times, device_delay_ms,
+                           out=amplitude_times)
             step_current_params = {
-                 'amplitude_values': list(
-                    numpy.ravel(pq.Quantity(signal, 'pA'))),
-                 'amplitude_times': list(numpy.ravel(numpy.asarray(
-                     signal.times.rescale(pq.ms))) - self.device_delay_ms),
+                 'amplitude_values': numpy.ravel(numpy.asarray(
+                     signal.rescale(pq.pA), dtype=float)),
+                 'amplitude_times': amplitude_times,
                  'start': t_start,
                  'stop': float(signal.t_stop.rescale(pq.ms))}
             self._inputs[port_name] = nest.Create(
                 'step_current_generator', 1, step_current_params)
             nest.Connect(self._inputs[port_name], self._cell, syn_spec={
                 "receptor_type": self._receive_ports[port_name],
-                'delay': self.device_delay_ms})
+                'delay': device_delay_ms})
         else:
             raise Pype9UsageError(
                 "Unrecognised port type '{}' to play signal into".format(port))
@@ -306,3 +302,9 @@ class CellMetaClass(base.CellMetaClass):
     CodeGenerator = CodeGenerator
     BaseCellClass = Cell
     Simulation = Simulation
+
+    @classmethod
+    def _simulator_class_members(cls, name):
+        # The receptor types are fixed for a given NEST model so only query
+        # them once per built class rather than once per cell instance
+        return {'_receptor_types': nest.GetDefaults(name)['receptor_types']}
@@ -26,6 +26,7 @@ import pype9
 from pype9.utils.logging import logger
 
 cmake_success_re = re.compile(r'-- Build files have been written to: (.*)')
+sli_install_prefix_re = re.compile(r'\(([^\)]+)/share/nest/sli\)')
 
 
 class CodeGenerator(BaseCodeGenerator):
@@ -156,7 +157,7 @@ class CodeGenerator(BaseCodeGenerator):
             fail_msg=("Compilation of '{}' NEST module failed (see compile "
                       "directory '{}'):\n\n {{}}".format(component_name,
                                                          compile_dir)))
-        if re.search(r'error:', stderr):  # Ignores warnings
+        if 'error:' in stderr:  # Ignores warnings
             raise Pype9BuildError(
                 "Compilation of '{}' NEST module directory failed:\n\n{}\n{}"
                 .format(compile_dir, stdout, stderr))
@@ -263,7 +264,7 @@ class CodeGenerator(BaseCodeGenerator):
                 "subprocess:\n{}".format(e))
         if PY3:
             stdout = str(stdout.decode('utf-8'))
-        match = re.search(r'\(([^\)]+)/share/nest/sli\)', stdout)
+        match = sli_install_prefix_re.search(stdout)
         if match is None:
             raise Pype9BuildError(
                 "Could not find nest install prefix by searching for "
@@ -38,6 +38,27 @@ basic_nineml_translations = {'Voltage': 'v', 'Diameter': 'diam', 'Length': 'L'}
 NEURON_NS = 'NEURON'
 
 
+def _hoc_vector(values):
+    """
+    Creates a hoc Vector from an array of values with a single buffer copy
+    instead of copying it element by element through the interpreter
+    """
+    values = numpy.ascontiguousarray(values, dtype=float).ravel()
+    vector = h.Vector(values.size)
+    vector.from_python(values)
+    return vector
+
+
+def _magnitude_in(quantity, units):
+    """
+    Returns the magnitude of a quantity in the given units, skipping the
+    rescaling (and the copy it makes) if it is already in those units
+    """
+    if quantity.dimensionality == units.dimensionality:
+        return quantity.magnitude
+    return quantity.rescale(units).magnitude
+
+
 class Cell(base.Cell):
     """
     Base class for Neuron cell objects.
@@ -57,6 +78,7 @@ class Cell(base.Cell):
         self._flag_created(False)
         # Construct all the NEURON structures
         self._sec = h.Section()  # @UndefinedVariable
+        self._update_surface_area()
         # Insert dynamics mechanism (the built component class)
         HocClass = getattr(h, self.__class__.name)
         self._hoc = HocClass(0.5, sec=self._sec)
@@ -86,17 +108,17 @@ class Cell(base.Cell):
             # implementation)
             self._sec.L = 10.0
             self._sec.diam = 10.0 / pi
+            self._update_surface_area()
             self.cm_param_name = self.build_component_class.annotations.get(
                 (BUILD_TRANS, PYPE9_NS), MEMBRANE_CAPACITANCE)
             if self.cm_param_name not in self.component_class.parameter_names:
                 # Set capacitance to capacitance of section to default value
                 # for input currents
+                default_cm = float(self.DEFAULT_CM.in_units(un.nF))
                 # Set capacitance in NMODL
-                setattr(self._hoc, self.cm_param_name,
-                        float(self.DEFAULT_CM.in_units(un.nF)))
+                setattr(self._hoc, self.cm_param_name, default_cm)
                 # Set capacitance in HOC section
-                specific_cm = self.DEFAULT_CM / self.surface_area
-                self._sec.cm = float(specific_cm.in_units(un.uF / un.cm ** 2))
+                self._sec.cm = self._specific_cm(default_cm)
             self.recordable[self.component_class.annotations.get(
                 (BUILD_TRANS, PYPE9_NS),
                 MEMBRANE_VOLTAGE)] = self.source_section(0.5)._ref_v
@@ -201,41 +223,71 @@ class Cell(base.Cell):
 
     @property
     def surface_area(self):
-        return (self._sec.L * un.um) * (self._sec.diam * pi * un.um)
+        return self._surface_area_um2 * un.um ** 2
+
+    def _update_surface_area(self):
+        # Cache the surface area (um^2) as a float as it is required each time
+        # the capacitance is set. Set via object.__setattr__ as this can be
+        # called from _set after the cell is created
+        object.__setattr__(self, '_surface_area_um2',
+                           self._sec.L * self._sec.diam * pi)
+
+    def _specific_cm(self, cm):
+        """
+        Converts a capacitance in nF to the specific capacitance of the
+        section in uF/cm^2 (1 nF/um^2 == 1e5 uF/cm^2)
+        """
+        return float(cm) * 1e5 / self._surface_area_um2
+
+    def _target_of(self, varname):
+        """
+        Returns the hoc object that holds the variable (either the mechanism or
+        the section) along with its escaped name. Whether the variable is held
+        by the mechanism is the same for all cells of the class so it is only
+        checked once per variable
+        """
+        try:
+            in_mechanism, name = self._variable_targets[varname]
+        except KeyError:
+            name = self._escaped_name(varname)
+            in_mechanism = hasattr(self._hoc, name)
+            self._variable_targets[varname] = (in_mechanism, name)
+        return (self._hoc if in_mechanism else self._sec), name
 
     def _get(self, varname):
-        varname = self._escaped_name(varname)
+        target, name = self._target_of(varname)
         try:
-            return getattr(self._hoc, varname)
+            return getattr(target, name)
         except AttributeError:
-            try:
-                return getattr(self._sec, varname)
-            except AttributeError:
-                raise Pype9UsageError(
-                    "'{}' doesn't have an attribute '{}'"
-                    .format(self.name, varname))
+            raise Pype9UsageError(
+                "'{}' doesn't have an attribute '{}'"
+                .format(self.name, name))
 
     def _set(self, varname, val):
-        try:
-            setattr(self._hoc, varname, val)
+        target, name = self._target_of(varname)
+        if target is self._hoc:
+            setattr(self._hoc, name, val)
             # If capacitance, also set the section capacitance
             if varname == self.cm_param_name:
                 # This assumes that the value of the capacitance is in nF
                 # which it should be from the super setattr method
-                self._sec.cm = float((
-                    val * un.nF / self.surface_area).in_units(un.uF /
-                                                              un.cm ** 2))
-        except LookupError:
-            varname = self._escaped_name(varname)
+                self._sec.cm = self._specific_cm(val)
+        else:
             try:
-                setattr(self._sec, varname, val)
+                setattr(self._sec, name, val)
+                if name in ('L', 'diam'):
+                    self._update_surface_area()
+                    # The specific capacitance of the section depends on its
+                    # surface area, so the capacitance needs to be set again
+                    # even if its value hasn't changed
+                    self._param_values.pop(self.cm_param_name, None)
             except AttributeError:
                 # Check to see if parameter has been removed in build
                 # transform and if not raise the error
-                if varname not in self.component_class.parameter_names:
+                if name not in self.component_class.parameter_names:
                     raise AttributeError(
                         "Could not set '{}' to hoc object or NEURON section"
-                        .format(varname))
+                        .format(name))
 
     def _set_regime(self):
         setattr(self._hoc, self.code_generator.REGIME_VARNAME, self._regime_index)
@@ -253,10 +305,7 @@ class Cell(base.Cell):
         """
         self._initialize_local_recording()
         # Get the port or state variable to record
-        try:
-            port = self.component_class.send_port(port_name)
-        except NineMLNameError:
-            port = self.component_class.state_variable(port_name)
+        port = self._recordable(port_name)
         # Set up Hoc vector to hold the recording
         self._recordings[port_name] = recording = h.Vector()
         if isinstance(port, EventPort):
@@ -301,10 +350,7 @@ class Cell(base.Cell):
             t_start = UnitHandler.to_pq_quantity(self._t_start)
         t_start = pq.Quantity(t_start, 'ms')
         t_stop = self.unit_handler.to_pq_quantity(t_stop)
-        try:
-            port = self.component_class.port(port_name)
-        except NineMLNameError:
-            port = self.component_class.state_variable(port_name)
+        port = self._recordable(port_name)
         if isinstance(port, EventPort):
             events = numpy.asarray(self._recordings[port_name])
             recording = neo.SpikeTrain(
@@ -372,9 +418,9 @@ class Cell(base.Cell):
                 raise Pype9UsageError(
                     "Signal must start at or after 1 ms to handle delay in "
                     "neuron ({})".format(signal.t_start))
-            times = numpy.asarray(signal.times.rescale(pq.ms)) - 1.0
+            times = _magnitude_in(signal.times, pq.ms) - 1.0
             vstim = h.VecStim()
-            vstim_times = h.Vector(times)
+            vstim_times = _hoc_vector(times)
             vstim.play(vstim_times)
             vstim_con = h.NetCon(vstim, self._hoc, sec=self._sec)
             self._check_connection_properties(port_name, properties)
@@ -395,8 +441,8 @@ class Cell(base.Cell):
             iclamp.delay = 0.0
             iclamp.dur = 1e12
             iclamp.amp = 0.0
-            iclamp_amps = h.Vector(pq.Quantity(signal, 'nA'))
-            iclamp_times = h.Vector(signal.times.rescale(pq.ms))
+            iclamp_amps = _hoc_vector(_magnitude_in(signal, pq.nA))
+            iclamp_times = _hoc_vector(_magnitude_in(signal.times, pq.ms))
             iclamp_amps.play(iclamp._ref_amp, iclamp_times)
             self._inputs['iclamp'] = iclamp
             self._input_auxs.extend((iclamp_amps, iclamp_times))
@@ -471,18 +517,14 @@ class Cell(base.Cell):
         seclamp = h.SEClamp(0.5, sec=self._sec)
         seclamp.rs = series_resistance
         seclamp.dur1 = 1e12
-        seclamp_amps = h.Vector(pq.Quantity(voltages, 'mV'))
-        seclamp_times = h.Vector(voltages.times.rescale(pq.ms))
+        seclamp_amps = _hoc_vector(_magnitude_in(voltages, pq.mV))
+        seclamp_times = _hoc_vector(_magnitude_in(voltages.times, pq.ms))
         seclamp_amps.play(seclamp._ref_amp, seclamp_times)
         self._inputs['seclamp'] = seclamp
         self._input_auxs.extend((seclamp_amps, seclamp_times))
 
     def _escaped_name(self, name):
-        if name == self.component_class.annotations.get(
-                (BUILD_TRANS, PYPE9_NS), MEMBRANE_VOLTAGE):
-            name = self.build_component_class.annotations.get(
-                (BUILD_TRANS, PYPE9_NS), MEMBRANE_VOLTAGE)
-        return name
+        return self._build_names.get(name, name)
 
     @classmethod
     def get_v_threshold(self, dynamics_properties, port_name):
@@ -566,6 +608,12 @@ class CellMetaClass(base.CellMetaClass):
     BaseCellClass = Cell
     Simulation = Simulation
 
+    @classmethod
+    def _simulator_class_members(cls, name):  # @UnusedVariable
+        # Targets (mechanism or section) of each variable, filled on first
+        # access
+        return {'_variable_targets': {}}
+
 
 class OuputEventTransitionsFinder(BaseVisitorWithContext):
     """
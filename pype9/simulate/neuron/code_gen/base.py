@@ -51,6 +51,8 @@ import logging
 
 TRANSFORM_NS = 'NeuronBuildTransform'
 
+makefile_cc_re = re.compile(r'\s*CC\s*=\s*(.*)')
+
 logger = logging.getLogger("pype9")
 
 
@@ -129,9 +131,11 @@ class CodeGenerator(BaseCodeGenerator):
         # Get list of all unique triggers within the component class so they
         # can be referred to by an index (i.e. their index in the list).
         all_triggers = []
+        seen_triggers = set()
         for regime in component_class.regimes:
             for on_condition in regime.on_conditions:
-                if on_condition.trigger.rhs not in all_triggers:
+                if on_condition.trigger.rhs not in seen_triggers:
+                    seen_triggers.add(on_condition.trigger.rhs)
                     all_triggers.append(on_condition.trigger.rhs)
         tmpl_args = {
             'code_gen': self,
@@ -406,6 +410,12 @@ class CodeGenerator(BaseCodeGenerator):
                 ext_is.append(ext_i)
         except KeyError:
             ext_is = []
+            # Count the number of expressions each symbol appears in so the
+            # expressions don't need to be rescanned for each port
+            num_exprs_with = defaultdict(int)
+            for expr in component_class.all_expressions:
+                for sym in expr.free_symbols:
+                    num_exprs_with[sym] += 1
             for port in chain(component_class.analog_receive_ports,
                               component_class.analog_reduce_ports):
                 # Check to see if the receive/reduce port has current dimension
@@ -420,8 +430,7 @@ class CodeGenerator(BaseCodeGenerator):
                     continue
                 # Get the number of expressions the receive port appears in
                 # an expression
-                if len([e for e in component_class.all_expressions
-                        if port.symbol in e.free_symbols]) > 1:
+                if num_exprs_with[port.symbol] > 1:
                     continue
                 # If all those conditions are met guess that port is a external
                 # current that can be removed (ports that don't meet these
@@ -664,7 +673,7 @@ class CodeGenerator(BaseCodeGenerator):
             raise Pype9BuildError(
                 "Could not read nrnmech_makefile at '{}'"
                 .format(nrnmech_makefile_path))
-        matches = re.findall(r'\s*CC\s*=\s*(.*)', contents)
+        matches = makefile_cc_re.findall(contents)
         if len(matches) != 1:
             raise Pype9BuildError(
                 "Could not extract CC variable from nrnmech_makefile at '{}'"
@@ -40,9 +40,6 @@ class ComponentArray(BaseComponentArray, pyNN.neuron.Population):
     UnitHandler = UnitHandler
     Simulation = Simulation
 
-    def __init__(self, *args, **kwargs):
-        super(ComponentArray, self).__init__(*args, **kwargs)
-
     @property
     def _min_delay(self):
         return get_min_delay()
@@ -6,8 +6,6 @@
 """
 # from pype9.utils.mpi import mpi_comm
 import os.path
-import nineml
-import ninemlcatalog
 from argparse import ArgumentTypeError
 import pype9.utils.logging.handlers.sysout  # @UnusedImport
 
@@ -22,6 +20,8 @@ def existing_file(fname):
 
 
 def nineml_document(doc_path):
+    import nineml
+    import ninemlcatalog
     if doc_path.startswith(CATALOG_PREFIX):
         model = ninemlcatalog.load(doc_path[len(CATALOG_PREFIX):])
     else:
@@ -34,6 +34,7 @@ def nineml_document(doc_path):
 
 
 def nineml_model(model_path):
+    import nineml
     model = nineml_document(model_path)
     if isinstance(model, nineml.Document):
         model = model.as_network(
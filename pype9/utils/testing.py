@@ -607,9 +607,10 @@ class ReferenceBrunel2000(object):
                 conns = copy(conns)
                 conns[:, 0] += p1[0]
                 conns[:, 1] += p2[0]
-                for i in numpy.unique(conns[:, 1]):
-                    nest.Connect(list(conns[(conns[:, 1] == i), 0]), [i],
-                                 'all_to_all', syn)
+                # Connect all the pairs in a single call rather than one call
+                # per target neuron
+                nest.Connect(list(conns[:, 0]), list(conns[:, 1]),
+                             'one_to_one', syn)
         else:
             # We now iterate over all neuron IDs, and connect the neuron to the
             # sources from our array. The first loop connects the excitatory
@@ -1,9 +1,14 @@
 from __future__ import division
 from __future__ import print_function
+import os
+import shutil
+import tempfile
+from mock import patch
 import ninemlcatalog
 from nineml.abstraction import Parameter, TimeDerivative, StateVariable
 import nineml.units as un
 from pype9.simulate.nest import CellMetaClass
+from pype9.simulate.nest.code_gen import CodeGenerator
 from pype9.simulate.common.cells.with_synapses import WithSynapses
 from pype9.exceptions import Pype9BuildMismatchError
 from unittest import TestCase  # @Reimport
@@ -28,3 +33,92 @@ class TestSeeding(TestCase):
             Pype9BuildMismatchError,
             CellMetaClass,
             izhi2_wrap)
+
+
+class TestBuildCache(TestCase):
+
+    def setUp(self):
+        self.izhi = WithSynapses.wrap(
+            ninemlcatalog.load('neuron/Izhikevich.xml#Izhikevich'))
+
+    def test_cached_build(self):
+        Cell = CellMetaClass(self.izhi, build_version='Cached')
+        with patch.object(CodeGenerator, 'transform_for_build',
+                          autospec=True,
+                          side_effect=CodeGenerator.transform_for_build) as (
+                              transform_for_build):
+            self.assertIs(CellMetaClass(self.izhi, build_version='Cached'),
+                          Cell)
+        self.assertEqual(transform_for_build.call_count, 0)
+
+    def test_cached_build_kwargs_mismatch(self):
+        izhi2 = self.izhi.clone()
+        izhi2.add(Parameter('zp', dimension=un.time))
+        izhi2_build = CodeGenerator().transform_for_build(
+            name=izhi2.name, component_class=izhi2)
+        Cell = CellMetaClass(self.izhi, build_version='CachedKwargs')
+        # Different build options are transformed again and checked against
+        # the previously built class
+        with patch.object(CodeGenerator, 'transform_for_build',
+                          autospec=True,
+                          side_effect=CodeGenerator.transform_for_build) as (
+                              transform_for_build):
+            self.assertIs(
+                CellMetaClass(self.izhi, build_version='CachedKwargs',
+                              max_step_size=0.01),
+                Cell)
+        self.assertEqual(transform_for_build.call_count, 1)
+        with patch.object(CodeGenerator, 'transform_for_build',
+                          return_value=izhi2_build) as transform_for_build:
+            self.assertRaises(
+                Pype9BuildMismatchError,
+                CellMetaClass,
+                self.izhi,
+                build_version='CachedKwargs',
+                max_step_size=0.02)
+        self.assertEqual(transform_for_build.call_count, 1)
+
+
+class TestLazyBuild(TestCase):
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.code_gen = CodeGenerator(base_dir=self.base_dir)
+        izhi = WithSynapses.wrap(
+            ninemlcatalog.load('neuron/Izhikevich.xml#Izhikevich'))
+        self.component_class = self.code_gen.transform_for_build(
+            name=izhi.name, component_class=izhi)
+        self.stamp_pth = os.path.join(
+            self.code_gen.get_source_dir(self.component_class.name,
+                                         self.component_class.url),
+            CodeGenerator._COMPILED_STAMP)
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir)
+
+    @patch.object(CodeGenerator, 'configure_build_files')
+    @patch.object(CodeGenerator, 'generate_source_files')
+    @patch.object(CodeGenerator, 'compile_source_files')
+    def test_lazy_build(self, compile_source_files, *args):  # @UnusedVariable
+        self.code_gen.generate(self.component_class, build_mode='lazy')
+        self.assertEqual(compile_source_files.call_count, 1)
+        with open(self.stamp_pth) as f:
+            self.assertEqual(f.read(), self.code_gen.simulator_build_id())
+        # Unchanged sources compiled against the same simulator installation
+        self.code_gen.generate(self.component_class, build_mode='lazy')
+        self.assertEqual(compile_source_files.call_count, 1)
+        # Simulator reinstalled since the previous compilation
+        with patch.object(CodeGenerator, 'simulator_build_id',
+                          return_value='reinstalled'):
+            self.code_gen.generate(self.component_class, build_mode='lazy')
+        self.assertEqual(compile_source_files.call_count, 2)
+
+    @patch.object(CodeGenerator, 'configure_build_files')
+    @patch.object(CodeGenerator, 'generate_source_files')
+    @patch.object(CodeGenerator, 'compile_source_files')
+    def test_regenerate_removes_stamp(self, *args):  # @UnusedVariable
+        self.code_gen.generate(self.component_class, build_mode='lazy')
+        self.assertTrue(os.path.exists(self.stamp_pth))
+        self.code_gen.generate(self.component_class,
+                               build_mode='generate_only')
+        self.assertFalse(os.path.exists(self.stamp_pth))
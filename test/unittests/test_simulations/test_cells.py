@@ -3,14 +3,19 @@ from __future__ import print_function
 from __future__ import division
 from builtins import zip
 import sys
+import numpy
 import quantities as pq
+import neo
 from itertools import chain, repeat
 import logging
+from mock import patch
 import ninemlcatalog
 from nineml import units as un
 from nineml.user import Property
 from nineml.user.multi.dynamics import MultiDynamics
 from nineml.user import DynamicsProperties
+from nineml.abstraction import (
+    Dynamics, Regime, OnEvent, OutputEvent, EventReceivePort, EventSendPort)
 from pype9.simulate.common.cells import (
     MultiDynamicsWithSynapses, DynamicsWithSynapsesProperties,
     ConnectionParameterSet, ConnectionPropertySet)
@@ -18,11 +23,13 @@ from pype9.simulate.neuron import (
     CellMetaClass as NeuronCellMetaClass,
     Simulation as NeuronSimulation)
 argv = sys.argv[1:]  # Save argv before it is clobbered by the NEST init.
+import nest  # @IgnorePep8
 from pype9.simulate.nest import (  # @IgnorePep8
     CellMetaClass as NESTCellMetaClass,
     Simulation as NESTSimulation)
 from pype9.utils.testing import Comparer, input_step, input_freq  # @IgnorePep8
 from pype9.simulate.nest.units import UnitHandler as UnitHandlerNEST  # @IgnorePep8
+from pype9.exceptions import Pype9UsageError  # @IgnorePep8
 import pype9.utils.logging.handlers.sysout  # @IgnorePep8
 if __name__ == '__main__':
     from pype9.utils.testing import DummyTestCase as TestCase  # @UnusedImport
@@ -436,6 +443,95 @@ class TestDynamics(TestCase):
                      sim_name, recorded_rate, ref_rate, 2.5 * pq.Hz,
                      recorded_rate - ref_rate)))
 
+    def test_nest_play_spikes_before_device_delay(self, **kwargs):  # @UnusedVariable @IgnorePep8
+        parrot9ML = Dynamics(
+            name="Parrot",
+            regimes=[
+                Regime(name="default",
+                       transitions=[
+                           OnEvent("spike_in",
+                                   output_events=[
+                                       OutputEvent('spike_out')])])],
+            event_ports=[EventReceivePort(name='spike_in'),
+                         EventSendPort(name='spike_out')])
+        Parrot = NESTCellMetaClass(parrot9ML, build_version='TestDyn')
+        spikes = neo.SpikeTrain([0.5, 5.0, 10.0], units='ms',
+                                t_stop=20.0 * pq.ms)
+        with NESTSimulation(dt=0.1 * un.ms, device_delay=1.0 * un.ms):
+            parrot = Parrot()
+            # The first spike is before the device delay so can't be played
+            self.assertRaises(Pype9UsageError, parrot.play, 'spike_in',
+                              spikes)
+
+    def test_nest_play_analog(self, **kwargs):  # @UnusedVariable
+        Izhikevich = NESTCellMetaClass(
+            ninemlcatalog.load('neuron/Izhikevich', 'Izhikevich'),
+            build_version='TestDyn')
+        amplitudes = numpy.arange(1.0, 11.0)
+        signal = neo.AnalogSignal(amplitudes, units='pA',
+                                  sampling_period=1.0 * pq.ms,
+                                  t_start=5.0 * pq.ms)
+        with NESTSimulation(dt=0.1 * un.ms, device_delay=1.0 * un.ms):
+            izhi = Izhikevich(ninemlcatalog.load('neuron/Izhikevich',
+                                                 'SampleIzhikevich'))
+            izhi.play('Isyn', signal)
+            times, values = nest.GetStatus(
+                izhi._inputs['Isyn'],
+                ('amplitude_times', 'amplitude_values'))[0]
+        # The signal times are shifted back by the device delay
+        self.assertTrue(
+            numpy.allclose(times, numpy.arange(5.0, 15.0) - 1.0),
+            "Step current times ({}) were not shifted by the device delay"
+            .format(times))
+        self.assertTrue(
+            numpy.allclose(values, amplitudes),
+            "Step current amplitudes ({}) don't match signal ({})"
+            .format(values, amplitudes))
+
+    def test_unchanged_parameter(self, simulators=SIMULATORS_TO_TEST,
+                                 build_mode=BUILD_MODE_DEFAULT, **kwargs):  # @UnusedVariable @IgnorePep8
+        izhi = ninemlcatalog.load('neuron/Izhikevich', 'Izhikevich')
+        izhi_props = ninemlcatalog.load('neuron/Izhikevich',
+                                        'SampleIzhikevich')
+        for sim_name in simulators:
+            celltype = cell_metaclasses[sim_name](
+                izhi, build_mode=build_mode, build_version='TestDyn')
+            if sim_name == 'neuron':
+                Simulation = NeuronSimulation(dt=0.1 * un.ms,
+                                              seed=NEURON_RNG_SEED)
+            else:
+                Simulation = NESTSimulation(dt=0.1 * un.ms,
+                                            seed=NEST_RNG_SEED)
+            with Simulation:
+                cell = celltype(izhi_props)
+                cell.c = -60.0 * un.mV
+                with patch.object(celltype, '_set') as mock_set:
+                    # Assigning the same value shouldn't reach the simulator
+                    cell.c = -60.0 * un.mV
+                    self.assertFalse(
+                        mock_set.called,
+                        "Unchanged value of 'c' was set again in {}"
+                        .format(sim_name))
+                    cell.c = -55.0 * un.mV
+                    self.assertEqual(
+                        mock_set.call_count, 1,
+                        "Changed value of 'c' was not set in {}"
+                        .format(sim_name))
+                if (sim_name == 'neuron' and cell.cm_param_name in
+                        cell.component_class.parameter_names):
+                    # Changing the section length changes the specific
+                    # capacitance so the capacitance should be set again
+                    cm_name = cell.cm_param_name
+                    cm = getattr(cell, cm_name)
+                    setattr(cell, cm_name, cm)
+                    cell._set('L', 20.0)
+                    with patch.object(celltype, '_set') as mock_set:
+                        setattr(cell, cm_name, cm)
+                        self.assertEqual(
+                            mock_set.call_count, 1,
+                            "Capacitance was not set again after the section "
+                            "length changed")
+
 
 if __name__ == '__main__':
     import argparse
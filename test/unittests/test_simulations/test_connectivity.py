@@ -0,0 +1,45 @@
+from __future__ import division
+import numpy
+import ninemlcatalog
+from nineml.user import ConnectionRuleProperties
+from pyNN.random import NumpyRNG
+from pype9.simulate.common.network.connectivity import PyNNConnectivity
+if __name__ == '__main__':
+    from pype9.utils.testing import DummyTestCase as TestCase  # @UnusedImport
+else:
+    from unittest import TestCase  # @Reimport
+
+
+class TestPyNNConnectivity(TestCase):
+
+    num_pre = 200
+    num_post = 300
+    p_connect = 0.05
+
+    def test_sample_sparse(self):
+        rule_properties = ConnectionRuleProperties(
+            'probabilistic_props',
+            ninemlcatalog.load('/connectionrule/Probabilistic',
+                               'Probabilistic'),
+            {'probability': self.p_connect})
+        connectivity = PyNNConnectivity(
+            rule_properties, self.num_pre, self.num_post,
+            rng=NumpyRNG(seed=12345))
+        conns = connectivity._sample_sparse(self.p_connect, self.num_pre,
+                                            self.num_post)
+        self.assertEqual(conns.shape[1], 2)
+        self.assertTrue(((conns[:, 0] >= 0) &
+                         (conns[:, 0] < self.num_pre)).all(),
+                        "Pre-synaptic indices out of range")
+        self.assertTrue(((conns[:, 1] >= 0) &
+                         (conns[:, 1] < self.num_post)).all(),
+                        "Post-synaptic indices out of range")
+        self.assertEqual(len(set(map(tuple, conns))), len(conns),
+                         "Pairs were connected more than once")
+        num_pairs = self.num_pre * self.num_post
+        expected = self.p_connect * num_pairs
+        std = numpy.sqrt(num_pairs * self.p_connect * (1 - self.p_connect))
+        self.assertLess(
+            abs(len(conns) - expected), 5 * std,
+            "Number of sampled connections ({}) does not match the expected "
+            "number ({})".format(len(conns), expected))